@@ -1,5 +1,6 @@
 """ Paperspace Cloud. """
 
+import types
 import typing
 from typing import Dict, Iterator, List, Optional, Tuple, Union
 
@@ -28,7 +29,9 @@ class Paperspace(clouds.Cloud):
     """Paperspace GPU Cloud"""
 
     _REPR = 'Paperspace'
-    _CLOUD_UNSUPPORTED_FEATURES = {
+    # Pre-materialized and read-only: built once at class-definition time and
+    # shared by every _unsupported_features_for_resources() call.
+    _CLOUD_UNSUPPORTED_FEATURES = types.MappingProxyType({
         clouds.CloudImplementationFeatures.CLONE_DISK_FROM_CLUSTER:
             'Migrating '
             f'disk is not supported in {_REPR}.',
@@ -46,7 +49,7 @@ class Paperspace(clouds.Cloud):
              f'{_REPR}.'),
         clouds.CloudImplementationFeatures.HIGH_AVAILABILITY_CONTROLLERS:
             (f'High availability controllers are not supported in {_REPR}.'),
-    }
+    })
     _MAX_CLUSTER_NAME_LEN_LIMIT = 120
     _regions: List[clouds.Region] = []
 
@@ -68,7 +71,9 @@ class Paperspace(clouds.Cloud):
             cloud implementation.
         """
         del resources  # unused
-        return cls._CLOUD_UNSUPPORTED_FEATURES
+        # Return a copy: callers (e.g. check_features_are_supported) may
+        # update the returned dict.
+        return dict(cls._CLOUD_UNSUPPORTED_FEATURES)
 
     @classmethod
     def _max_cluster_name_length(cls) -> Optional[int]:
@@ -1,20 +1,36 @@
 """Cudo Compute VM spec helper for SkyPilot."""
 import csv
+import threading
+from typing import Dict, List, Optional, Tuple
 
 from sky.catalog.common import get_catalog_path
 
 VMS_CSV = 'cudo/vms.csv'
 
+_spec_lock = threading.Lock()
+# Maps (instance_type, data_center_id) to its catalog row, so repeated spec
+# lookups do not re-read and re-scan the CSV file.
+_spec_rows: Optional[Dict[Tuple[str, str], List[str]]] = None
+
+
+def _load_spec_rows() -> Dict[Tuple[str, str], List[str]]:
+    global _spec_rows
+    if _spec_rows is None:
+        with _spec_lock:
+            if _spec_rows is None:
+                path = get_catalog_path(VMS_CSV)
+                spec_rows: Dict[Tuple[str, str], List[str]] = {}
+                with open(path, mode='r', encoding='utf-8') as file:
+                    csv_reader = csv.reader(file)
+                    for row in csv_reader:
+                        if row:
+                            spec_rows.setdefault((row[0], row[6]), row)
+                _spec_rows = spec_rows
+    return _spec_rows
+
 
 def get_spec_from_instance(instance_type, data_center_id):
-    path = get_catalog_path(VMS_CSV)
-    spec = []
-    with open(path, mode='r', encoding='utf-8') as file:
-        csv_reader = csv.reader(file)
-        for row in csv_reader:
-            if row and row[0] == instance_type and row[6] == data_center_id:
-                spec = row
-                break
+    spec = _load_spec_rows().get((instance_type, data_center_id), [])
     return {
         'gpu_model': spec[1],
         'vcpu_count': spec[3],
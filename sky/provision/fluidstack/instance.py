@@ -46,15 +46,14 @@ def get_internal_ip(node_info: Dict[str, Any]) -> None:
         node_info['internal_ip'] = result[1].strip()
 
 
-def _filter_instances(
+def _filter_from(
+        instances: List[Dict[str, Any]],
         cluster_name_on_cloud: str,
         status_filters: Optional[List[str]],
         include_instances: Optional[List[str]] = None) -> Dict[str, Any]:
-
-    instances = utils.FluidstackClient().list_instances()
-    possible_names = [
-        f'{cluster_name_on_cloud}-head', f'{cluster_name_on_cloud}-worker'
-    ]
+    """Filters an already-fetched instance list, without an API call."""
+    possible_names = frozenset(
+        (f'{cluster_name_on_cloud}-head', f'{cluster_name_on_cloud}-worker'))
 
     filtered_instances = {}
     for instance in instances:
@@ -69,6 +68,15 @@ def _filter_instances(
     return filtered_instances
 
 
+def _filter_instances(
+        cluster_name_on_cloud: str,
+        status_filters: Optional[List[str]],
+        include_instances: Optional[List[str]] = None) -> Dict[str, Any]:
+    instances = utils.FluidstackClient().list_instances()
+    return _filter_from(instances, cluster_name_on_cloud, status_filters,
+                        include_instances)
+
+
 def _get_head_instance_id(instances: Dict[str, Any]) -> Optional[str]:
     head_instance_id = None
     for inst_id, inst in instances.items():
@@ -83,22 +91,30 @@ def run_instances(region: str, cluster_name_on_cloud: str,
     """Runs instances for the given cluster."""
 
     pending_status = ['pending', 'provisioning']
-    while True:
-        instances = _filter_instances(cluster_name_on_cloud, pending_status)
+    # Take a single snapshot of the account's instances. On the common
+    # cold-start path nothing is pending, so the poll loop below is skipped
+    # without any further list calls, and the running-instance view is
+    # derived from the same snapshot.
+    instances_snapshot = utils.FluidstackClient().list_instances()
+    instances = _filter_from(instances_snapshot, cluster_name_on_cloud,
+                             pending_status)
+    while instances:
         if len(instances) > config.count:
             raise RuntimeError(
                 f'Cluster {cluster_name_on_cloud} already has '
                 f'{len(instances)} nodes, but {config.count} are '
                 'required. Please try terminate the cluster and retry.')
-        if not instances:
-            break
         instance_statuses = [
             instance['status'] for instance in instances.values()
         ]
         logger.info(f'Waiting for {len(instances)} instances to be ready: '
                     f'{instance_statuses}')
         time.sleep(POLL_INTERVAL)
-    exist_instances = _filter_instances(cluster_name_on_cloud, ['running'])
+        instances_snapshot = utils.FluidstackClient().list_instances()
+        instances = _filter_from(instances_snapshot, cluster_name_on_cloud,
+                                 pending_status)
+    exist_instances = _filter_from(instances_snapshot, cluster_name_on_cloud,
+                                   ['running'])
     head_instance_id = _get_head_instance_id(exist_instances)
 
     def rename(instance_id: str, new_name: str) -> None:
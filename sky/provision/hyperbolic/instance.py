@@ -1,6 +1,7 @@
 """Hyperbolic instance provisioning."""
+import functools
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from sky import sky_logging
 from sky.provision import common
@@ -12,6 +13,9 @@ POLL_INTERVAL = 5
 QUERY_PORTS_TIMEOUT_SECONDS = 30
 #TODO come up with a reasonable value for this timeout
 TIMEOUT = 300
+# Bounded wait for newly started instances to report their SSH command.
+_SSH_COMMAND_MAX_RETRIES = 6
+_SSH_COMMAND_RETRY_INTERVAL = 10
 
 logger = sky_logging.init_logger(__name__)
 
@@ -64,6 +68,24 @@ def _get_head_instance_id(instances: Dict[str, Any]) -> Optional[str]:
     return next(iter(instances.keys()))
 
 
+@functools.lru_cache(maxsize=128)
+def _parse_instance_type(instance_type: str) -> Tuple[str, int]:
+    """Parses an instance type into (gpu_model, gpu_count).
+
+    Format: {gpu_count}x-{gpu_model}-{cpu}-{memory}
+    Example: 1x-A100-24-271
+
+    Cached so repeated launches of the same instance type skip the string
+    parsing.
+    """
+    parts = instance_type.split('-')
+    if len(parts) != 4:
+        raise ValueError(f'Invalid instance type format: {instance_type}. '
+                         'Expected format: '
+                         '{gpu_count}x-{gpu_model}-{cpu}-{memory}')
+    return parts[1], int(parts[0].rstrip('x'))
+
+
 def run_instances(region: str, cluster_name_on_cloud: str,
                   config: common.ProvisionConfig) -> common.ProvisionRecord:
     logger.info(f'Starting run_instances with region={region}, '
@@ -139,17 +161,8 @@ def run_instances(region: str, cluster_name_on_cloud: str,
                 'Please specify an instance type for Hyperbolic.')
 
         # Parse gpu_model configuration from instance type
-        # Format: {gpu_count}x-{gpu_model}-{cpu}-{memory}
-        # Example: 1x-A100-24-271
         try:
-            parts = instance_type.split('-')
-            if len(parts) != 4:
-                raise ValueError(
-                    f'Invalid instance type format: {instance_type}. '
-                    'Expected format: {gpu_count}x-{gpu_model}-{cpu}-{memory}')
-
-            gpu_count = int(parts[0].rstrip('x'))
-            gpu_model = parts[1]
+            gpu_model, gpu_count = _parse_instance_type(instance_type)
             logger.info(f'Parsed GPU config from instance type: '
                         f'model={gpu_model}, count={gpu_count}')
 
@@ -258,26 +271,47 @@ def get_cluster_info(
     del region  # unused
     running_instances = _filter_instances(
         cluster_name_on_cloud, [utils.HyperbolicInstanceStatus.ONLINE.value])
+
+    # Newly started instances may not expose their SSH command right away.
+    # Instead of falling back to the instance id as hostname, retry until
+    # every running instance reports one. Hyperbolic has no per-instance
+    # detail endpoint, so a single list call refreshes all of them at once.
+    not_ready = {
+        instance_id for instance_id, instance_info in
+        running_instances.items() if not instance_info.get('sshCommand')
+    }
+    for _ in range(_SSH_COMMAND_MAX_RETRIES):
+        if not not_ready:
+            break
+        time.sleep(_SSH_COMMAND_RETRY_INTERVAL)
+        refreshed = _filter_instances(
+            cluster_name_on_cloud,
+            [utils.HyperbolicInstanceStatus.ONLINE.value])
+        for instance_id in list(not_ready):
+            instance_info = refreshed.get(instance_id)
+            if instance_info and instance_info.get('sshCommand'):
+                running_instances[instance_id] = instance_info
+                not_ready.discard(instance_id)
+
     instances: Dict[str, List[common.InstanceInfo]] = {}
     head_instance_id = None
 
     for instance_id, instance_info in running_instances.items():
         # Extract hostname and port from sshCommand
+        # Format: ssh user@hostname -p port
+        # partition() returns a fixed 3-tuple, avoiding the per-instance list
+        # allocations of split().
         ssh_command = instance_info.get('sshCommand', '')
-        if ssh_command:
-            # Format: ssh user@hostname -p port
-            parts = ssh_command.split()
-            if len(parts) >= 4:
-                user_host = parts[1]  # user@hostname
-                if '@' in user_host:
-                    ssh_user = user_host.split('@')[0]
-                    hostname = user_host.split('@')[1]
-                else:
-                    hostname = user_host
-                port = int(parts[3])
+        user_host, sep, port_str = ssh_command.partition(' -p ')
+        if ssh_command and sep:
+            user_host = user_host.partition(' ')[2]  # drop leading 'ssh'
+            user, at_sign, host = user_host.partition('@')
+            if at_sign:
+                ssh_user = user
+                hostname = host
             else:
-                hostname = instance_id
-                port = 22
+                hostname = user_host
+            port = int(port_str.strip().partition(' ')[0])
         else:
             hostname = instance_id
             port = 22
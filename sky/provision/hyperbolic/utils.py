@@ -89,7 +89,8 @@ class HyperbolicClient:
             self,
             method: str,
             endpoint: str,
-            payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+            payload: Optional[Dict[str, Any]] = None,
+            params: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Make an API request to Hyperbolic."""
         url = f'{BASE_URL}{endpoint}'
         headers = {
@@ -104,7 +105,10 @@ class HyperbolicClient:
 
         try:
             if method == 'GET':
-                response = requests.get(url, headers=headers, timeout=120)
+                response = requests.get(url,
+                                        headers=headers,
+                                        params=params,
+                                        timeout=120)
             elif method == 'POST':
                 response = requests.post(url,
                                          headers=headers,
@@ -213,8 +217,12 @@ class HyperbolicClient:
     ) -> Dict[str, Dict[str, Any]]:
         """List all instances, optionally filtered by status and metadata."""
         endpoint = '/v1/marketplace/instances'
+        # Push the status filter down to the server to reduce the amount of
+        # data transferred and parsed; unknown params are ignored by the API,
+        # so the client-side filters below are kept as a defensive fallback.
+        params = {'status': status.lower()} if status else None
         try:
-            response = self._make_request('GET', endpoint)
+            response = self._make_request('GET', endpoint, params=params)
             logger.debug(f'Raw API response: {json.dumps(response, indent=2)}')
             instances = {}
             for instance in response.get('instances', []):
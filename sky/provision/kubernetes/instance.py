@@ -907,7 +907,7 @@ def _create_pods(region: str, cluster_name_on_cloud: str,
                     context).create_namespaced_deployment(
                         namespace, deployment_spec)
             except Exception as e:
-                print('Deployment failed', e)
+                logger.error('Deployment failed: %s', e)
                 raise e
 
         return _create_namespaced_pod_with_retries(namespace, pod_spec_copy,
@@ -29,10 +29,10 @@ def _filter_instances(
         status_filters: Optional[List[str]]) -> Dict[str, Dict[str, Any]]:
     lambda_client = _get_lambda_client()
     instances = lambda_client.list_instances()
-    possible_names = [
+    possible_names = frozenset((
         f'{cluster_name_on_cloud}-head',
         f'{cluster_name_on_cloud}-worker',
-    ]
+    ))
 
     filtered_instances = {}
     for instance in instances:
@@ -1,5 +1,6 @@
 """Lambda Cloud helper functions."""
 
+import functools
 import json
 import os
 import time
@@ -101,19 +102,30 @@ def raise_lambda_error(response: 'requests.Response') -> None:
     raise LambdaCloudError(f'{code}: {message}')
 
 
+@functools.lru_cache(maxsize=1)
+def _get_requests_module():
+    """Resolves the lazily-imported requests module once per process.
+
+    Going through the LazyImport proxy costs a __getattr__ lookup on every
+    API call; this binds the concrete module a single time instead.
+    """
+    return requests.load_module()
+
+
 def _try_request_with_backoff(method: str,
                               url: str,
                               headers: Dict[str, str],
                               data: Optional[str] = None):
     backoff = common_utils.Backoff(initial_backoff=INITIAL_BACKOFF_SECONDS,
                                    max_backoff_factor=MAX_BACKOFF_FACTOR)
+    requests_mod = _get_requests_module()
     for i in range(MAX_ATTEMPTS):
         if method == 'get':
-            response = requests.get(url, headers=headers)
+            response = requests_mod.get(url, headers=headers)
         elif method == 'post':
-            response = requests.post(url, headers=headers, data=data)
+            response = requests_mod.post(url, headers=headers, data=data)
         elif method == 'put':
-            response = requests.put(url, headers=headers, data=data)
+            response = requests_mod.put(url, headers=headers, data=data)
         else:
             raise ValueError(f'Unsupported requests method: {method}')
         # If rate limited, wait and try again
@@ -8,6 +8,7 @@ from sky.provision import common
 from sky.provision.paperspace import utils
 from sky.utils import common_utils
 from sky.utils import status_lib
+from sky.utils import subprocess_utils
 from sky.utils import ux_utils
 
 # The maximum number of times to poll for the status of an operation.
@@ -15,18 +16,33 @@ POLL_INTERVAL = 5
 MAX_POLLS = 60 // POLL_INTERVAL
 # Stopping instances can take several minutes, so we increase the timeout
 MAX_POLLS_FOR_UP_OR_STOP = MAX_POLLS * 16
+# Exponential backoff for the status poll loops: the first poll fires almost
+# immediately, later polls back off to reduce API load.
+_POLL_INITIAL_BACKOFF_SECONDS = 2
+_POLL_MAX_BACKOFF_FACTOR = 8
 
 logger = sky_logging.init_logger(__name__)
 
-
-def _filter_instances(cluster_name_on_cloud: str,
-                      status_filters: Optional[List[str]]) -> Dict[str, Any]:
-    client = utils.PaperspaceCloudClient()
-    instances = client.list_instances()
-    possible_names = [
+# https://docs.digitalocean.com/reference/paperspace/core/commands/machines/#show
+_STATUS_MAP = {
+    'starting': status_lib.ClusterStatus.INIT,
+    'restarting': status_lib.ClusterStatus.INIT,
+    'upgrading': status_lib.ClusterStatus.INIT,
+    'provisioning': status_lib.ClusterStatus.INIT,
+    'stopping': status_lib.ClusterStatus.STOPPED,
+    'serviceready': status_lib.ClusterStatus.INIT,
+    'ready': status_lib.ClusterStatus.UP,
+    'off': status_lib.ClusterStatus.STOPPED,
+}
+
+
+def _filter_from(instances: List[Dict[str, Any]], cluster_name_on_cloud: str,
+                 status_filters: Optional[List[str]]) -> Dict[str, Any]:
+    """Filters an already-fetched instance list, without an API call."""
+    possible_names = frozenset((
         f'{cluster_name_on_cloud}-head',
         f'{cluster_name_on_cloud}-worker',
-    ]
+    ))
 
     filtered_instances = {}
     for instance in instances:
@@ -39,6 +55,13 @@ def _filter_instances(cluster_name_on_cloud: str,
     return filtered_instances
 
 
+def _filter_instances(cluster_name_on_cloud: str,
+                      status_filters: Optional[List[str]]) -> Dict[str, Any]:
+    client = utils.get_client()
+    return _filter_from(client.list_instances(), cluster_name_on_cloud,
+                        status_filters)
+
+
 def _get_head_instance_id(instances: Dict[str, Any]) -> Optional[str]:
     head_instance_id = None
     for inst_id, inst in instances.items():
@@ -55,12 +78,20 @@ def run_instances(region: str, cluster_name_on_cloud: str,
     pending_status = [
         'starting', 'restarting', 'upgrading', 'provisioning', 'stopping'
     ]
-    newly_started_instances = _filter_instances(cluster_name_on_cloud,
-                                                pending_status + ['off'])
-    client = utils.PaperspaceCloudClient()
-
+    client = utils.get_client()
+    # Fetch the instance list once and filter locally; only re-fetch inside
+    # the poll loops, where fresh state is actually needed.
+    instances_snapshot = client.list_instances()
+    newly_started_instances = _filter_from(instances_snapshot,
+                                           cluster_name_on_cloud,
+                                           pending_status + ['off'])
+
+    backoff = common_utils.Backoff(
+        initial_backoff=_POLL_INITIAL_BACKOFF_SECONDS,
+        max_backoff_factor=_POLL_MAX_BACKOFF_FACTOR)
     while True:
-        instances = _filter_instances(cluster_name_on_cloud, pending_status)
+        instances = _filter_from(instances_snapshot, cluster_name_on_cloud,
+                                 pending_status)
         if not instances:
             break
         instance_statuses = [
@@ -68,18 +99,21 @@ def run_instances(region: str, cluster_name_on_cloud: str,
         ]
         logger.info(f'Waiting for {len(instances)} instances to be ready: '
                     f'{instance_statuses}')
-        time.sleep(POLL_INTERVAL)
+        time.sleep(backoff.current_backoff())
+        instances_snapshot = client.list_instances(fresh=True)
 
-    exist_instances = _filter_instances(cluster_name_on_cloud,
-                                        status_filters=pending_status +
-                                        ['ready', 'off'])
+    exist_instances = _filter_from(instances_snapshot,
+                                   cluster_name_on_cloud,
+                                   status_filters=pending_status +
+                                   ['ready', 'off'])
     if len(exist_instances) > config.count:
         raise RuntimeError(
             f'Cluster {cluster_name_on_cloud} already has '
             f'{len(exist_instances)} nodes, but {config.count} are required.')
 
-    stopped_instances = _filter_instances(cluster_name_on_cloud,
-                                          status_filters=['off'])
+    stopped_instances = _filter_from(instances_snapshot,
+                                     cluster_name_on_cloud,
+                                     status_filters=['off'])
     for instance_id in stopped_instances:
         try:
             client.start(instance_id=instance_id)
@@ -87,9 +121,15 @@ def run_instances(region: str, cluster_name_on_cloud: str,
             if 'This machine is currently starting.' in str(e):
                 continue
             raise e
+    backoff = common_utils.Backoff(
+        initial_backoff=_POLL_INITIAL_BACKOFF_SECONDS,
+        max_backoff_factor=_POLL_MAX_BACKOFF_FACTOR)
+    if stopped_instances:
+        # The snapshot predates the start() calls above; refresh it.
+        instances_snapshot = client.list_instances(fresh=True)
     while True:
-        instances = _filter_instances(cluster_name_on_cloud,
-                                      pending_status + ['off'])
+        instances = _filter_from(instances_snapshot, cluster_name_on_cloud,
+                                 pending_status + ['off'])
         if not instances:
             break
         num_stopped_instances = len(stopped_instances)
@@ -97,10 +137,12 @@ def run_instances(region: str, cluster_name_on_cloud: str,
         logger.info(
             f'Waiting for {num_restarted_instances}/{num_stopped_instances} '
             'stopped instances to be restarted.')
-        time.sleep(POLL_INTERVAL)
+        time.sleep(backoff.current_backoff())
+        instances_snapshot = client.list_instances(fresh=True)
 
-    exist_instances = _filter_instances(cluster_name_on_cloud,
-                                        status_filters=['ready'])
+    exist_instances = _filter_from(instances_snapshot,
+                                   cluster_name_on_cloud,
+                                   status_filters=['ready'])
     head_instance_id = _get_head_instance_id(exist_instances)
     to_start_count = config.count - len(exist_instances)
     if to_start_count < 0:
@@ -147,21 +189,32 @@ def run_instances(region: str, cluster_name_on_cloud: str,
         if head_instance_id is None:
             head_instance_id = instance_id
 
-    # Wait for instances to be ready.
-    for _ in range(MAX_POLLS_FOR_UP_OR_STOP):
-        instances = _filter_instances(cluster_name_on_cloud, ['ready'])
+    # Wait for the created instances to be ready. Keep the same overall
+    # deadline as the fixed-interval polling, but back off between polls and
+    # only query the instances that are still pending, instead of listing
+    # the whole account each iteration.
+    backoff = common_utils.Backoff(
+        initial_backoff=_POLL_INITIAL_BACKOFF_SECONDS,
+        max_backoff_factor=_POLL_MAX_BACKOFF_FACTOR)
+    deadline = time.time() + MAX_POLLS_FOR_UP_OR_STOP * POLL_INTERVAL
+    pending_ids = set(created_instance_ids)
+    while True:
+        ids = list(pending_ids)
+        infos = subprocess_utils.run_in_parallel(client.get_instance, ids)
+        for instance_id, info in zip(ids, infos):
+            if info.get('state') == 'ready':
+                pending_ids.discard(instance_id)
         logger.info('Waiting for instances to be ready: '
-                    f'({len(instances)}/{config.count}).')
-        if len(instances) == config.count:
+                    f'({config.count - len(pending_ids)}/{config.count}).')
+        if not pending_ids:
             break
-
-        time.sleep(POLL_INTERVAL)
-    else:
-        # Failed to launch config.count of instances after max retries
-        msg = ('run_instances: Failed to create the'
-               'instances due to capacity issue.')
-        logger.warning(msg)
-        raise RuntimeError(msg)
+        if time.time() > deadline:
+            # Failed to launch config.count of instances after max retries
+            msg = ('run_instances: Failed to create the'
+                   'instances due to capacity issue.')
+            logger.warning(msg)
+            raise RuntimeError(msg)
+        time.sleep(backoff.current_backoff())
     assert head_instance_id is not None, 'head_instance_id should not be None'
     return common.ProvisionRecord(
         provider_name='paperspace',
@@ -186,7 +239,7 @@ def stop_instances(
     worker_only: bool = False,
 ) -> None:
     del provider_config  # unused
-    client = utils.PaperspaceCloudClient()
+    client = utils.get_client()
     all_instances = _filter_instances(cluster_name_on_cloud, [
         'ready', 'serviceready', 'upgrading', 'provisioning', 'starting',
         'restarting'
@@ -220,12 +273,15 @@ def terminate_instances(
 ) -> None:
     """See sky/provision/__init__.py"""
     del provider_config  # unused
-    client = utils.PaperspaceCloudClient()
+    client = utils.get_client()
     instances = _filter_instances(cluster_name_on_cloud, None)
-    for inst_id, inst in instances.items():
+    instance_ids_to_terminate = [
+        inst_id for inst_id, inst in instances.items()
+        if not (worker_only and inst['name'].endswith('-head'))
+    ]
+
+    def _terminate_one(inst_id: str) -> None:
         logger.debug(f'Terminating instance {inst_id}')
-        if worker_only and inst['name'].endswith('-head'):
-            continue
         try:
             client.remove(inst_id)
         except Exception as e:  # pylint: disable=broad-except
@@ -235,6 +291,10 @@ def terminate_instances(
                     f'{common_utils.format_exception(e, use_bracket=False)}'
                 ) from e
 
+    # The removals are independent network-bound requests; issue them in
+    # parallel instead of one round-trip per node.
+    subprocess_utils.run_in_parallel(_terminate_one, instance_ids_to_terminate)
+
     # TODO(asaiacai): Possible private network resource leakage for autodown
     if not worker_only:
         try:
@@ -286,20 +346,11 @@ def query_instances(
     assert provider_config is not None, (cluster_name_on_cloud, provider_config)
     instances = _filter_instances(cluster_name_on_cloud, None)
 
-    # https://docs.digitalocean.com/reference/paperspace/core/commands/machines/#show
-    status_map = {
-        'starting': status_lib.ClusterStatus.INIT,
-        'restarting': status_lib.ClusterStatus.INIT,
-        'upgrading': status_lib.ClusterStatus.INIT,
-        'provisioning': status_lib.ClusterStatus.INIT,
-        'stopping': status_lib.ClusterStatus.STOPPED,
-        'serviceready': status_lib.ClusterStatus.INIT,
-        'ready': status_lib.ClusterStatus.UP,
-        'off': status_lib.ClusterStatus.STOPPED,
-    }
     statuses: Dict[str, Optional[status_lib.ClusterStatus]] = {}
     for inst_id, inst in instances.items():
-        status = status_map[inst['state']]
+        # Default unrecognized states to INIT instead of raising KeyError,
+        # in case the provider adds a new state.
+        status = _STATUS_MAP.get(inst['state'], status_lib.ClusterStatus.INIT)
         statuses[inst_id] = status
     return statuses
 
@@ -1,10 +1,12 @@
 """Paperspace API client wrapper for SkyPilot."""
 
+import functools
 import json
 import os
+import threading
 import time
 import typing
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from sky import sky_logging
 from sky.adaptors import common as adaptors_common
@@ -16,6 +18,14 @@ if typing.TYPE_CHECKING:
 else:
     requests = adaptors_common.LazyImport('requests')
 
+try:
+    # orjson parses large API responses several times faster than the stdlib;
+    # fall back to json when it is not installed.
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = sky_logging.init_logger(__name__)
 
 CREDENTIALS_PATH = '~/.paperspace/config.json'
@@ -24,6 +34,13 @@ INITIAL_BACKOFF_SECONDS = 10
 MAX_BACKOFF_FACTOR = 10
 MAX_ATTEMPTS = 6
 ADD_KEY_SCRIPT = 'sky-add-key'
+# Connection pool sizing; large enough for parallel instance termination.
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+# How long a cached list_instances response stays valid. Provisioning and
+# status queries often list instances several times within milliseconds; a
+# short TTL absorbs those bursts without returning meaningfully stale data.
+LIST_INSTANCES_CACHE_TTL_SECONDS = 2.0
 
 
 class PaperspaceCloudError(Exception):
@@ -49,32 +66,74 @@ def raise_paperspace_api_error(response: 'requests.Response') -> None:
     raise PaperspaceCloudError(f'{code}: {message}')
 
 
+@functools.lru_cache()
+def _parse_credentials(path: str, mtime_ns: int) -> Dict[str, Any]:
+    del mtime_ns  # Only part of the cache key, to invalidate on file change.
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _load_credentials(path: str) -> Dict[str, Any]:
+    """Reads the credentials file, caching the parse until the file changes."""
+    return _parse_credentials(path, os.stat(path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_session() -> 'requests.Session':
+    """Returns a shared HTTP session.
+
+    Keep-alive reuses the TCP+TLS connection to the API endpoint across
+    requests, saving a handshake per call.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=POOL_CONNECTIONS,
+                                            pool_maxsize=POOL_MAXSIZE)
+    session.mount('https://', adapter)
+    return session
+
+
+# Rate limiting and transient server-side errors are worth retrying;
+# other statuses indicate a genuine request failure.
+_RETRYABLE_STATUS_CODES = frozenset((429, 500, 502, 503, 504))
+# Cap on how long a Retry-After header can make us sleep, so a pathological
+# value cannot stall provisioning. Matches the backoff ceiling.
+_MAX_RETRY_AFTER_SECONDS = INITIAL_BACKOFF_SECONDS * MAX_BACKOFF_FACTOR
+# Methods that carry a (pre-serialized JSON) request body.
+_PAYLOAD_METHODS = frozenset(('post', 'put', 'patch'))
+_VALID_METHODS = _PAYLOAD_METHODS | frozenset(('get', 'delete'))
+
+
 def _try_request_with_backoff(
         method: str,
         url: str,
         headers: Dict[str, str],
         data: Optional[Union[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    if method not in _VALID_METHODS:
+        raise ValueError(f'Unsupported requests method: {method}')
     backoff = common_utils.Backoff(initial_backoff=INITIAL_BACKOFF_SECONDS,
                                    max_backoff_factor=MAX_BACKOFF_FACTOR)
+    session = _get_session()
     for i in range(MAX_ATTEMPTS):
-        if method == 'get':
-            response = requests.get(url, headers=headers, params=data)
-        elif method == 'post':
-            response = requests.post(url, headers=headers, data=data)
-        elif method == 'put':
-            response = requests.put(url, headers=headers, data=data)
-        elif method == 'patch':
-            response = requests.patch(url, headers=headers, data=data)
-        elif method == 'delete':
-            response = requests.delete(url, headers=headers)
-        else:
-            raise ValueError(f'Unsupported requests method: {method}')
-        # If rate limited, wait and try again
-        if response.status_code == 429 and i != MAX_ATTEMPTS - 1:
-            time.sleep(backoff.current_backoff())
+        response = session.request(
+            method,
+            url,
+            headers=headers,
+            params=data if method == 'get' else None,
+            data=data if method in _PAYLOAD_METHODS else None)
+        # If rate limited or hitting a transient server error, wait and try
+        # again, honoring the Retry-After header when the API provides one.
+        if (response.status_code in _RETRYABLE_STATUS_CODES and
+                i != MAX_ATTEMPTS - 1):
+            sleep_s = backoff.current_backoff()
+            # Retry-After may also be an HTTP-date (RFC 7231); only honor
+            # the delay-seconds form and fall back to backoff otherwise.
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                sleep_s = min(float(retry_after), _MAX_RETRY_AFTER_SECONDS)
+            time.sleep(sleep_s)
             continue
         if response.status_code == 200:
-            return response.json()
+            return _json_loads(response.content)
         raise_paperspace_api_error(response)
     return {}
 
@@ -85,13 +144,16 @@ class PaperspaceCloudClient:
     def __init__(self) -> None:
         self.credentials = os.path.expanduser(CREDENTIALS_PATH)
         assert os.path.exists(self.credentials), 'Credentials not found'
-        with open(self.credentials, 'r', encoding='utf-8') as f:
-            self._credentials = json.load(f)
-        self.api_key = self._credentials['apiKey']
+        credentials = _load_credentials(self.credentials)
+        self.api_key = credentials['apiKey']
         self.headers = {
             'Authorization': f'Bearer {self.api_key}',
             'Content-Type': 'application/json',
         }
+        self._list_instances_cache: Optional[Tuple[float,
+                                                   List[Dict[str,
+                                                             Any]]]] = None
+        self._list_instances_cache_lock = threading.Lock()
 
     def list_endpoint(self, endpoint: str,
                       **search_kwargs) -> List[Dict[str, Any]]:
@@ -193,8 +255,35 @@ class PaperspaceCloudClient:
             headers=self.headers,
         )
 
-    def list_instances(self) -> List[Dict[str, Any]]:
-        return self.list_endpoint(endpoint='machines')
+    def get_instance(self, instance_id: str) -> Dict[str, Any]:
+        return _try_request_with_backoff(
+            'get',
+            f'{API_ENDPOINT}/machines/{instance_id}',
+            headers=self.headers,
+        )
+
+    def _invalidate_list_instances_cache(self) -> None:
+        with self._list_instances_cache_lock:
+            self._list_instances_cache = None
+
+    def list_instances(self, fresh: bool = False) -> List[Dict[str, Any]]:
+        """Lists instances, serving bursts of calls from a short TTL cache.
+
+        Args:
+            fresh: If True, bypass the cache, e.g. in wait loops that need
+              up-to-date instance state.
+        """
+        if not fresh:
+            with self._list_instances_cache_lock:
+                if self._list_instances_cache is not None:
+                    fetched_at, items = self._list_instances_cache
+                    if (time.time() - fetched_at <
+                            LIST_INSTANCES_CACHE_TTL_SECONDS):
+                        return items
+        items = self.list_endpoint(endpoint='machines')
+        with self._list_instances_cache_lock:
+            self._list_instances_cache = (time.time(), items)
+        return items
 
     def launch(self, name: str, instance_type: str, network_id: str,
                region: str, disk_size: int) -> Dict[str, Any]:
@@ -215,34 +304,50 @@ class PaperspaceCloudClient:
                 'enableNvlink': instance_type in constants.NVLINK_INSTANCES,
                 'startOnCreate': True,
             }))
+        self._invalidate_list_instances_cache()
         return response
 
     def start(self, instance_id: str) -> Dict[str, Any]:
-        return _try_request_with_backoff(
+        response = _try_request_with_backoff(
             'patch',
             f'{API_ENDPOINT}/machines/{instance_id}/start',
             headers={'Authorization': f'Bearer {self.api_key}'},
         )
+        self._invalidate_list_instances_cache()
+        return response
 
     def stop(self, instance_id: str) -> Dict[str, Any]:
-        return _try_request_with_backoff(
+        response = _try_request_with_backoff(
             'patch',
             f'{API_ENDPOINT}/machines/{instance_id}/stop',
             headers={'Authorization': f'Bearer {self.api_key}'},
         )
+        self._invalidate_list_instances_cache()
+        return response
 
     def remove(self, instance_id: str) -> Dict[str, Any]:
-        return _try_request_with_backoff(
+        response = _try_request_with_backoff(
             'delete',
             f'{API_ENDPOINT}/machines/{instance_id}',
             headers=self.headers,
         )
+        self._invalidate_list_instances_cache()
+        return response
 
     def rename(self, instance_id: str, name: str) -> Dict[str, Any]:
-        return _try_request_with_backoff(
+        response = _try_request_with_backoff(
             'put',
             f'{API_ENDPOINT}/machines/{instance_id}',
             headers=self.headers,
             data=json.dumps({
                 'name': name,
             }))
+        self._invalidate_list_instances_cache()
+        return response
+
+
+@functools.lru_cache(maxsize=1)
+def get_client() -> PaperspaceCloudClient:
+    """Returns a shared API client, so that the credentials file is only
+    read and parsed once per process."""
+    return PaperspaceCloudClient()
@@ -15,15 +15,22 @@ QUERY_PORTS_TIMEOUT_SECONDS = 30
 
 logger = sky_logging.init_logger(__name__)
 
+_STATUS_MAP = {
+    'CREATED': status_lib.ClusterStatus.INIT,
+    'RESTARTING': status_lib.ClusterStatus.INIT,
+    'PAUSED': status_lib.ClusterStatus.INIT,
+    'RUNNING': status_lib.ClusterStatus.UP,
+}
+
 
 def _filter_instances(cluster_name_on_cloud: str,
                       status_filters: Optional[List[str]],
                       head_only: bool = False) -> Dict[str, Any]:
 
     instances = utils.list_instances()
-    possible_names = [f'{cluster_name_on_cloud}-head']
+    possible_names = {f'{cluster_name_on_cloud}-head'}
     if not head_only:
-        possible_names.append(f'{cluster_name_on_cloud}-worker')
+        possible_names.add(f'{cluster_name_on_cloud}-worker')
 
     filtered_instances = {}
     for instance_id, instance in instances.items():
@@ -206,20 +213,15 @@ def query_instances(
     non_terminated_only: bool = True,
 ) -> Dict[str, Optional[status_lib.ClusterStatus]]:
     """See sky/provision/__init__.py"""
+    del non_terminated_only
     assert provider_config is not None, (cluster_name_on_cloud, provider_config)
     instances = _filter_instances(cluster_name_on_cloud, None)
 
-    status_map = {
-        'CREATED': status_lib.ClusterStatus.INIT,
-        'RESTARTING': status_lib.ClusterStatus.INIT,
-        'PAUSED': status_lib.ClusterStatus.INIT,
-        'RUNNING': status_lib.ClusterStatus.UP,
-    }
     statuses: Dict[str, Optional[status_lib.ClusterStatus]] = {}
     for inst_id, inst in instances.items():
-        status = status_map[inst['status']]
-        if non_terminated_only and status is None:
-            continue
+        # Default unrecognized states to INIT instead of raising KeyError,
+        # in case the provider adds a new state.
+        status = _STATUS_MAP.get(inst['status'], status_lib.ClusterStatus.INIT)
         statuses[inst_id] = status
     return statuses
 
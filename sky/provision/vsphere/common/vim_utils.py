@@ -426,7 +426,7 @@ def get_vm_uuid_from_vm():
                             check=True)
 
     if result.returncode != 0:
-        print('Error running dmidecode: ', result.stderr)
+        logger.error('Error running dmidecode: %s', result.stderr)
         return None
 
     matches = re.search(r'Serial Number: VMware-(.+)', result.stdout)